@@ -28,6 +28,8 @@ source venv/bin/activate
 # Install dependencies
 echo "📥 Installing dependencies..."
 pip install -r requirements.txt -q
+# Faster JSON and --cassette support; the tests run without them
+pip install -r requirements-optional.txt -q || echo "⚠️  Optional dependencies not installed, continuing without them"
 
 # Run tests
 echo ""